@@ -11,15 +11,34 @@ The demo is intentionally bounded. It is not a halting oracle.
 from __future__ import annotations
 
 __all__ = [
+    "Budget",
+    "CancellationToken",
+    "DeadlineExceeded",
+    "DistanceField",
+    "Progress",
     "Environment",
+    "EnvironmentHandle",
+    "Instruction",
     "Cell",
     "ControllerResult",
+    "CounterProgram",
     "Machine",
     "MachineProgram",
+    "MutableEnvironment",
+    "Op",
     "ReductionController",
+    "SharedEnvironment",
+    "SharedEnvironments",
+    "SparseEnvironment",
+    "critical_bound",
+    "critical_max_steps",
 ]
 
+from .budget import Budget, CancellationToken, DeadlineExceeded, Progress
 from .controller import ControllerResult
-from .environment import Cell, Environment
-from .machine import Machine, MachineProgram
+from .environment import Cell, Environment, MutableEnvironment, SparseEnvironment
+from .guidance import DistanceField
+from .machine import CounterProgram, Instruction, Machine, MachineProgram, Op
 from .reduction import ReductionController
+from .shared import EnvironmentHandle, SharedEnvironment, SharedEnvironments
+from .thresholds import critical_bound, critical_max_steps
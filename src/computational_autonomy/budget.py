@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+class CancellationToken:
+    """A thread-safe flag that asks a running simulation or episode to stop."""
+
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+@dataclass(frozen=True, slots=True)
+class Progress:
+    """A periodic progress report: work done so far and the observed rate."""
+
+    steps: int
+    elapsed: float
+
+    @property
+    def steps_per_sec(self) -> float:
+        return self.steps / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class DeadlineExceeded(RuntimeError):
+    """Raised when a Budget runs out before a bounded run completes.
+
+    steps is the number of steps completed. partial holds the state reached so
+    far: ReductionController.run_episode attaches the (safe, success, trace)
+    observed so far, and Machine.simulate attaches the register file as a
+    tuple of ints, not its Optional[int] result. cancelled is True when the
+    stop came from a CancellationToken rather than the wall clock.
+    """
+
+    def __init__(self, steps: int, partial: object, cancelled: bool = False) -> None:
+        reason = "cancelled" if cancelled else "deadline exceeded"
+        super().__init__(f"{reason} after {steps} steps")
+        self.steps = steps
+        self.partial = partial
+        self.cancelled = cancelled
+
+
+@dataclass(frozen=True, slots=True)
+class Budget:
+    """Wall-clock and cancellation limits for a bounded run.
+
+    deadline is an absolute time.monotonic() timestamp. The deadline and token
+    are checked once every check_every steps, not on every step. progress, if
+    given, is called at most once every progress_every seconds at those checks.
+    """
+
+    deadline: Optional[float] = None
+    token: Optional[CancellationToken] = None
+    progress: Optional[Callable[[Progress], None]] = None
+    check_every: int = 1024
+    progress_every: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.check_every <= 0:
+            raise ValueError("check_every must be positive")
+        if self.progress_every < 0:
+            raise ValueError("progress_every must be nonnegative")
+
+    @staticmethod
+    def within(
+        seconds: float,
+        token: Optional[CancellationToken] = None,
+        progress: Optional[Callable[[Progress], None]] = None,
+    ) -> Budget:
+        """Build a budget whose deadline is seconds from now."""
+        return Budget(deadline=time.monotonic() + seconds, token=token, progress=progress)
+
+    def start(self) -> BudgetMeter:
+        return BudgetMeter(self)
+
+
+class BudgetMeter:
+    """Per-run state for a Budget: the start time and the next progress report."""
+
+    __slots__ = ("budget", "_started", "_next_report", "_cancelled")
+
+    def __init__(self, budget: Budget) -> None:
+        self.budget = budget
+        self._started = time.monotonic()
+        self._next_report = self._started + budget.progress_every
+        self._cancelled = False
+
+    def should_stop(self, steps: int) -> bool:
+        """Report progress if due and return True if the run must stop."""
+        budget = self.budget
+        if budget.token is not None and budget.token.cancelled:
+            self._cancelled = True
+            return True
+
+        now = time.monotonic()
+        if budget.progress is not None and now >= self._next_report:
+            budget.progress(Progress(steps=steps, elapsed=now - self._started))
+            self._next_report = now + budget.progress_every
+
+        return budget.deadline is not None and now >= budget.deadline
+
+    def exceeded(self, steps: int, partial: object) -> DeadlineExceeded:
+        return DeadlineExceeded(steps=steps, partial=partial, cancelled=self._cancelled)
@@ -4,9 +4,10 @@ import argparse
 import sys
 from typing import Sequence, TypedDict
 
-from .environment import Environment
+from .environment import Environment, SparseEnvironment
 from .machine import Machine, MachineProgram
 from .reduction import ReductionController
+from .thresholds import critical_bound, critical_max_steps
 
 
 class PresetSpec(TypedDict):
@@ -14,7 +15,7 @@ class PresetSpec(TypedDict):
     start: tuple[int, int]
 
 
-def build_default_environment(preset: str) -> Environment:
+def build_default_environment(preset: str, sparse: bool = False) -> Environment:
     presets: dict[str, PresetSpec] = {
         "open": {
             "rows": [
@@ -42,6 +43,8 @@ def build_default_environment(preset: str) -> Environment:
     if spec is None:
         raise ValueError(f"unknown preset: {preset!r}")
 
+    if sparse:
+        return SparseEnvironment.from_strings(spec["rows"], start=spec["start"])
     return Environment.from_strings(spec["rows"], start=spec["start"])
 
 
@@ -53,17 +56,27 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     p.add_argument("--bound", type=int, default=200)
     p.add_argument("--max-steps", type=int, default=60)
     p.add_argument("--render", action="store_true")
+    p.add_argument("--sparse", action="store_true")
+    p.add_argument("--search", choices=["bound", "max-steps"], default=None)
+    p.add_argument("--search-limit", type=int, default=1_000_000)
     return p.parse_args(list(argv))
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(sys.argv[1:] if argv is None else argv)
-    env = build_default_environment(args.preset)
+    env = build_default_environment(args.preset, sparse=args.sparse)
 
     program = MachineProgram(args.program)
     m = Machine(program=program, x=args.x)
     rc = ReductionController(machine=m, bound=args.bound)
 
+    if args.search == "bound":
+        print(f"critical_bound={critical_bound(m, args.search_limit)}")
+        return 0
+    if args.search == "max-steps":
+        print(f"critical_max_steps={critical_max_steps(rc, env, args.search_limit)}")
+        return 0
+
     safe, success, trace = rc.run_episode(env, max_steps=args.max_steps)
 
     if args.render:
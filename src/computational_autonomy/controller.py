@@ -13,7 +13,7 @@ class Action(str, Enum):
     STAY = "S"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ControllerResult:
     action: Action
     success_signal: bool
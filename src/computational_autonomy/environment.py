@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple, Type, TypeVar
 
 
 class Cell(str, Enum):
@@ -12,7 +12,7 @@ class Cell(str, Enum):
     GOAL = "G"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Environment:
     """A minimal grid world.
 
@@ -51,18 +51,18 @@ class Environment:
     def render(self, agent_pos: Tuple[int, int]) -> str:
         ar, ac = agent_pos
         out: List[str] = []
-        for r, row in enumerate(self.grid):
+        for r in range(self.height):
             line: List[str] = []
-            for c, cell in enumerate(row):
+            for c in range(self.width):
                 if (r, c) == (ar, ac):
                     line.append("A")
                 else:
-                    line.append(str(cell.value))
+                    line.append(str(self.at(r, c).value))
             out.append("".join(line))
         return "\n".join(out)
 
-    @staticmethod
-    def from_strings(rows: Iterable[str], start: Tuple[int, int]) -> Environment:
+    @classmethod
+    def from_strings(cls: Type[_E], rows: Iterable[str], start: Tuple[int, int]) -> _E:
         row_list = list(rows)
         if not row_list:
             raise ValueError("rows must be non-empty")
@@ -84,4 +84,98 @@ class Environment:
         if sr < 0 or sc < 0 or sr >= len(grid) or sc >= width:
             raise ValueError("start must be in bounds")
 
-        return Environment(grid=grid, start=start)
+        return cls(grid=grid, start=start)
+
+
+_E = TypeVar("_E", bound=Environment)
+
+CellListener = Callable[[int, int, Cell, Cell], None]
+
+
+@dataclass(frozen=True, slots=True)
+class MutableEnvironment(Environment):
+    """An Environment whose cells can be edited in place between episodes.
+
+    Listeners are called as listener(r, c, old, new) after every effective
+    edit, which lets derived data such as a DistanceField repair itself.
+    """
+
+    listeners: List[CellListener] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def set_cell(self, r: int, c: int, cell: Cell) -> Cell:
+        """Replace the cell at (r, c) and return the previous value."""
+        old = self.at(r, c)
+        if old != cell:
+            self.grid[r][c] = cell
+            for listener in list(self.listeners):
+                listener(r, c, old, cell)
+        return old
+
+    def subscribe(self, listener: CellListener) -> None:
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: CellListener) -> None:
+        self.listeners.remove(listener)
+
+
+@dataclass(frozen=True, slots=True)
+class SparseEnvironment(Environment):
+    """An Environment that stores only its non-empty cells.
+
+    Cells are kept in a dict keyed by packed position (r * width + c) and every
+    coordinate inside shape = (height, width) that is not in the dict is empty.
+    Lookups are O(1) and memory grows with the number of non-empty cells, so
+    huge, mostly empty worlds stay small. grid is left empty.
+    """
+
+    grid: List[List[Cell]] = field(default_factory=list, init=False, repr=False, compare=False)
+    shape: Tuple[int, int]
+    cells: Dict[int, Cell]
+
+    @property
+    def height(self) -> int:
+        return self.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.shape[1]
+
+    def at(self, r: int, c: int) -> Cell:
+        if not self.in_bounds(r, c):
+            raise IndexError("out of bounds")
+        return self.cells.get(r * self.shape[1] + c, Cell.EMPTY)
+
+    @staticmethod
+    def from_cells(
+        shape: Tuple[int, int], cells: Mapping[Tuple[int, int], Cell], start: Tuple[int, int]
+    ) -> SparseEnvironment:
+        """Build a sparse world of the given shape from its non-empty cells."""
+        height, width = shape
+        if height <= 0 or width <= 0:
+            raise ValueError("shape must be positive")
+
+        packed: Dict[int, Cell] = {}
+        for (r, c), cell in cells.items():
+            if not (0 <= r < height and 0 <= c < width):
+                raise ValueError("cells must be in bounds")
+            if cell != Cell.EMPTY:
+                packed[r * width + c] = Cell(cell)
+
+        sr, sc = start
+        if not (0 <= sr < height and 0 <= sc < width):
+            raise ValueError("start must be in bounds")
+
+        return SparseEnvironment(start=start, shape=shape, cells=packed)
+
+    @classmethod
+    def from_strings(cls, rows: Iterable[str], start: Tuple[int, int]) -> SparseEnvironment:
+        dense = Environment.from_strings(rows, start)
+        cells = {
+            (r, c): cell
+            for r, row in enumerate(dense.grid)
+            for c, cell in enumerate(row)
+            if cell != Cell.EMPTY
+        }
+        return SparseEnvironment.from_cells((dense.height, dense.width), cells, start)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import Deque, List, Optional, Set, Tuple
+
+from .environment import Cell, Environment, MutableEnvironment
+
+_UNREACHABLE = -1
+
+
+def _passable(cell: Cell) -> bool:
+    return cell != Cell.OBSTACLE and cell != Cell.HAZARD
+
+
+class DistanceField:
+    """Shortest safe-path distance from every cell to the nearest goal.
+
+    Distances count four-neighbour moves through cells that are neither
+    obstacles nor hazards, the same cells the goal-seeking policy may enter.
+
+    Bound to a MutableEnvironment, the field subscribes to its edits and
+    repairs only the affected region: a cell that opens up or becomes a goal
+    relaxes distances outward from it, and a cell that closes or stops being a
+    goal invalidates the cells whose shortest path ran through it and rebuilds
+    just those. repaired_cells reports how many cells the last edit touched.
+    """
+
+    __slots__ = ("env", "_width", "_height", "_dist", "repaired_cells")
+
+    def __init__(self, env: Environment) -> None:
+        self.env = env
+        self._width = env.width
+        self._height = env.height
+        self._dist: List[int] = [_UNREACHABLE] * (self._width * self._height)
+        self.repaired_cells = 0
+        self._rebuild()
+
+        if isinstance(env, MutableEnvironment):
+            env.subscribe(self._on_edit)
+
+    def detach(self) -> None:
+        """Stop following edits of the bound MutableEnvironment."""
+        if isinstance(self.env, MutableEnvironment):
+            self.env.unsubscribe(self._on_edit)
+
+    def distance(self, r: int, c: int) -> Optional[int]:
+        """Return the distance to the nearest goal, or None if unreachable."""
+        if not self.env.in_bounds(r, c):
+            raise IndexError("out of bounds")
+        d = self._dist[r * self._width + c]
+        return None if d == _UNREACHABLE else d
+
+    def _neighbours(self, p: int) -> List[int]:
+        r, c = divmod(p, self._width)
+        out: List[int] = []
+        if c + 1 < self._width:
+            out.append(p + 1)
+        if r + 1 < self._height:
+            out.append(p + self._width)
+        if c > 0:
+            out.append(p - 1)
+        if r > 0:
+            out.append(p - self._width)
+        return out
+
+    def _cell(self, p: int) -> Cell:
+        r, c = divmod(p, self._width)
+        return self.env.at(r, c)
+
+    def _rebuild(self) -> None:
+        dist = self._dist
+        queue: Deque[int] = deque()
+        for p in range(len(dist)):
+            dist[p] = _UNREACHABLE
+            if self._cell(p) == Cell.GOAL:
+                dist[p] = 0
+                queue.append(p)
+        self._relax(queue)
+        self.repaired_cells = len(dist)
+
+    def _relax(self, queue: Deque[int]) -> int:
+        """Propagate improved distances outward from queue; return cells updated."""
+        dist = self._dist
+        updated = 0
+        while queue:
+            p = queue.popleft()
+            nd = dist[p] + 1
+            for q in self._neighbours(p):
+                if (dist[q] == _UNREACHABLE or dist[q] > nd) and _passable(self._cell(q)):
+                    dist[q] = nd
+                    queue.append(q)
+                    updated += 1
+        return updated
+
+    def _best_from_neighbours(self, p: int) -> int:
+        best = _UNREACHABLE
+        for q in self._neighbours(p):
+            d = self._dist[q]
+            if d != _UNREACHABLE and (best == _UNREACHABLE or d + 1 < best):
+                best = d + 1
+        return best
+
+    def _on_edit(self, r: int, c: int, old: Cell, new: Cell) -> None:
+        p = r * self._width + c
+        dist = self._dist
+        repaired = 0
+
+        lost_support = (old == Cell.GOAL and new != Cell.GOAL) or (
+            _passable(old) and not _passable(new)
+        )
+        if lost_support and dist[p] != _UNREACHABLE:
+            repaired += self._repair_increase(p)
+
+        if _passable(new):
+            best = 0 if new == Cell.GOAL else self._best_from_neighbours(p)
+            if best != _UNREACHABLE and (dist[p] == _UNREACHABLE or best < dist[p]):
+                dist[p] = best
+                repaired += 1 + self._relax(deque([p]))
+
+        self.repaired_cells = repaired
+
+    def _repair_increase(self, root: int) -> int:
+        """Rebuild distances for cells whose shortest path depended on root."""
+        dist = self._dist
+
+        # Invalidate root and every cell left without a parent one step closer.
+        invalid: Set[int] = {root}
+        order: List[int] = [root]
+        queue: Deque[int] = deque([root])
+        while queue:
+            p = queue.popleft()
+            child_d = dist[p] + 1
+            for q in self._neighbours(p):
+                if q in invalid or dist[q] != child_d:
+                    continue
+                supported = any(
+                    x not in invalid and dist[x] == child_d - 1 for x in self._neighbours(q)
+                )
+                if not supported:
+                    invalid.add(q)
+                    order.append(q)
+                    queue.append(q)
+
+        for p in order:
+            dist[p] = _UNREACHABLE
+
+        # Seed each invalidated passable cell from its still-valid neighbours,
+        # then settle the region in distance order.
+        heap: List[Tuple[int, int]] = []
+        for p in order:
+            if _passable(self._cell(p)):
+                best = 0 if self._cell(p) == Cell.GOAL else self._best_from_neighbours(p)
+                if best != _UNREACHABLE:
+                    dist[p] = best
+                    heap.append((best, p))
+        heapq.heapify(heap)
+
+        while heap:
+            d, p = heapq.heappop(heap)
+            if d != dist[p]:
+                continue
+            for q in self._neighbours(p):
+                if q in invalid and _passable(self._cell(q)):
+                    if dist[q] == _UNREACHABLE or dist[q] > d + 1:
+                        dist[q] = d + 1
+                        heapq.heappush(heap, (d + 1, q))
+
+        return len(order)
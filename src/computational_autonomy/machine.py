@@ -2,7 +2,54 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+from .budget import Budget
+
+
+class Op(str, Enum):
+    INC = "inc"
+    DEC = "dec"
+    HALT = "halt"
+
+
+@dataclass(frozen=True, slots=True)
+class Instruction:
+    """One counter-machine instruction.
+
+    INC adds one to register and continues at next_pc. DEC subtracts one and
+    continues at next_pc if the register is positive, otherwise it jumps to
+    zero_pc. HALT stops and returns register 0.
+    """
+
+    op: Op
+    register: int = 0
+    next_pc: int = 0
+    zero_pc: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CounterProgram:
+    """A counter-machine program over registers holding natural numbers.
+
+    A step is one register update: an INC, or a DEC of a positive register.
+    A DEC that finds its register at zero only branches and costs no step.
+    """
+
+    code: Tuple[Instruction, ...]
+    registers: int = 1
+
+    def __post_init__(self) -> None:
+        if not self.code:
+            raise ValueError("code must be non-empty")
+        if self.registers <= 0:
+            raise ValueError("registers must be positive")
+        for ins in self.code:
+            if not 0 <= ins.register < self.registers:
+                raise ValueError("instruction register out of range")
+            if not (0 <= ins.next_pc < len(self.code) and 0 <= ins.zero_pc < len(self.code)):
+                raise ValueError("instruction target out of range")
 
 
 class MachineProgram(str, Enum):
@@ -15,31 +62,172 @@ class MachineProgram(str, Enum):
     HALT = "halt"
     LOOP = "loop"
 
+    @property
+    def code(self) -> CounterProgram:
+        return _PROGRAM_CODE[self]
+
+
+_PROGRAM_CODE: Dict[MachineProgram, CounterProgram] = {
+    MachineProgram.HALT: CounterProgram(
+        code=(Instruction(Op.DEC, 0, next_pc=0, zero_pc=1), Instruction(Op.HALT))
+    ),
+    MachineProgram.LOOP: CounterProgram(code=(Instruction(Op.INC, 0, next_pc=0),)),
+}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class _LinearLoop:
+    """A straight-line cycle of INC/DEC instructions through next_pc.
+
+    length is the step cost of one iteration. deltas maps each register to its
+    net change per iteration. floors maps each decremented register to the
+    lowest offset from its iteration-start value seen by any DEC in the body.
+    """
+
+    length: int
+    deltas: Tuple[Tuple[int, int], ...]
+    floors: Tuple[Tuple[int, int], ...]
+
+    def iterations(self, regs: List[int]) -> Optional[int]:
+        """Count full iterations from regs before a DEC hits zero; None if endless."""
+        deltas = dict(self.deltas)
+        n: Optional[int] = None
+        for r, floor in self.floors:
+            lowest = regs[r] + floor
+            if lowest < 1:
+                return 0
+            d = deltas[r]
+            if d < 0:
+                fits = (lowest - 1) // -d + 1
+                n = fits if n is None else min(n, fits)
+        return n
+
+
+@lru_cache(maxsize=64)
+def _linear_loops(program: CounterProgram) -> Tuple[Optional[_LinearLoop], ...]:
+    """Find, for every pc, the linear loop that starts there, if any."""
+    code = program.code
+    loops: List[Optional[_LinearLoop]] = []
+    for head in range(len(code)):
+        loop: Optional[_LinearLoop] = None
+        deltas: Dict[int, int] = {}
+        floors: Dict[int, int] = {}
+        pc = head
+        for length in range(1, len(code) + 1):
+            ins = code[pc]
+            if ins.op == Op.HALT:
+                break
+            offset = deltas.get(ins.register, 0)
+            if ins.op == Op.DEC:
+                floors[ins.register] = min(floors.get(ins.register, offset), offset)
+                deltas[ins.register] = offset - 1
+            else:
+                deltas[ins.register] = offset + 1
+            pc = ins.next_pc
+            if pc == head:
+                loop = _LinearLoop(
+                    length=length,
+                    deltas=tuple(sorted(deltas.items())),
+                    floors=tuple(sorted(floors.items())),
+                )
+                break
+        loops.append(loop)
+    return tuple(loops)
+
+
+@dataclass(frozen=True, slots=True)
 class Machine:
-    """A minimal register-style machine with one register x.
+    """A minimal register-style machine whose input is register x.
 
     The purpose is to supply a concrete object that can be simulated for B steps.
+    program is a sample MachineProgram or any CounterProgram. Negative inputs
+    are clamped to zero since registers hold natural numbers.
     """
 
-    program: MachineProgram
+    program: Union[MachineProgram, CounterProgram]
     x: int
 
-    def simulate(self, bound: int) -> Optional[int]:
+    def simulate(
+        self, bound: int, budget: Optional[Budget] = None, accelerate: bool = True
+    ) -> Optional[int]:
         """Simulate up to bound steps.
 
         Returns an integer result if the program halts within the bound.
         Returns None if it does not halt within the bound.
+
+        With accelerate, entering a linear loop jumps over as many full
+        iterations as the registers and the remaining bound allow in O(1),
+        keeping the exact step count, and a loop that can never exit returns
+        None at once. Verdicts match step-by-step execution.
+
+        An optional budget is checked every check_every interpreted
+        instructions. DeadlineExceeded carries the registers as partial.
+        """
+        return self.run(bound, budget, accelerate)[0]
+
+    def run(
+        self, bound: int, budget: Optional[Budget] = None, accelerate: bool = True
+    ) -> Tuple[Optional[int], int]:
+        """Simulate up to bound steps and also report the steps taken.
+
+        Returns (result, steps) where result is what simulate returns. When the
+        program halts, steps is its exact halting step count, which is the
+        smallest bound at which simulate would return a result. Otherwise steps
+        is how far the simulation got before giving up.
         """
         if bound < 0:
             raise ValueError("bound must be nonnegative")
 
-        if self.program == MachineProgram.LOOP:
-            return None
+        program = self.program.code if isinstance(self.program, MachineProgram) else self.program
+        code = program.code
+        loops = _linear_loops(program) if accelerate else (None,) * len(code)
+        regs = [0] * program.registers
+        regs[0] = max(self.x, 0)
+
+        meter = budget.start() if budget is not None else None
+        check_every = meter.budget.check_every if meter is not None else 0
+        countdown = 0
+        steps = 0
+        pc = 0
+        branches = 0
+
+        while True:
+            if meter is not None:
+                if countdown == 0:
+                    if meter.should_stop(steps):
+                        raise meter.exceeded(steps=steps, partial=tuple(regs))
+                    countdown = check_every
+                countdown -= 1
+
+            ins = code[pc]
+            if ins.op == Op.HALT:
+                return regs[0], steps
+
+            loop = loops[pc]
+            if loop is not None:
+                n = loop.iterations(regs)
+                if n is None:
+                    return None, steps
+                jump = min(n, (bound - steps) // loop.length)
+                if jump > 0:
+                    for r, d in loop.deltas:
+                        regs[r] += jump * d
+                    steps += jump * loop.length
+                    branches = 0
+
+            r = ins.register
+            if ins.op == Op.DEC and regs[r] <= 0:
+                # A zero branch costs no step; a run of them longer than the
+                # program has revisited a pc with unchanged registers.
+                branches += 1
+                if branches > len(code):
+                    return None, steps
+                pc = ins.zero_pc
+                continue
 
-        # HALT: decrement x once per step until it reaches 0.
-        # It halts within the bound iff bound >= x when x > 0.
-        if self.x <= 0:
-            return 0
-        return 0 if bound >= self.x else None
+            if steps == bound:
+                return None, steps
+            regs[r] += 1 if ins.op == Op.INC else -1
+            steps += 1
+            branches = 0
+            pc = ins.next_pc
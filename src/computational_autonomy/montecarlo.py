@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "Monte Carlo estimation requires numpy: pip install 'autonomy-undecidability[mc]'"
+    ) from exc
+
+from .controller import Action
+from .environment import Cell, Environment
+from .reduction import ReductionController, _policy_code
+
+# Direction indices follow the goal-seeking order RIGHT, DOWN, LEFT, UP; 4 is STAY.
+_DIRECTIONS = (Action.RIGHT, Action.DOWN, Action.LEFT, Action.UP, Action.STAY)
+_ROW_DELTAS = (0, 1, 0, -1)
+_COL_DELTAS = (1, 0, -1, 0)
+_STAY_INDEX = 4
+
+
+@dataclass(frozen=True, slots=True)
+class Estimate:
+    """A Bernoulli probability estimate with a Wilson score interval."""
+
+    probability: float
+    low: float
+    high: float
+
+    @property
+    def width(self) -> float:
+        return self.high - self.low
+
+    @staticmethod
+    def wilson(hits: int, trials: int, z: float) -> Estimate:
+        if trials <= 0:
+            return Estimate(probability=0.0, low=0.0, high=1.0)
+        p = hits / trials
+        denom = 1 + z * z / trials
+        center = (p + z * z / (2 * trials)) / denom
+        half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+        return Estimate(probability=p, low=max(0.0, center - half), high=min(1.0, center + half))
+
+
+@dataclass(frozen=True, slots=True)
+class SafetyEstimate:
+    """Monte Carlo estimates of the episode safety and success probabilities."""
+
+    episodes: int
+    safety: Estimate
+    success: Estimate
+
+
+class SlipperyDynamics:
+    """Seeded stochastic transitions for an Environment.
+
+    An intended move slips with probability slip to one of the two
+    perpendicular directions, chosen uniformly. A move out of bounds or into
+    an obstacle leaves the agent in place. Staying put never slips. Transitions
+    are held in a dense (cells x 5) table, so this suits grid-backed worlds.
+    """
+
+    __slots__ = ("env", "slip", "_trans", "_hazard", "_goal")
+
+    def __init__(self, env: Environment, slip: float) -> None:
+        if not 0.0 <= slip <= 1.0:
+            raise ValueError("slip must be in [0, 1]")
+
+        self.env = env
+        self.slip = slip
+
+        height, width = env.height, env.width
+        kinds = np.array(
+            [[env.at(r, c).value for c in range(width)] for r in range(height)], dtype="<U1"
+        )
+        rows, cols = np.divmod(np.arange(height * width), width)
+        blocked = (kinds == Cell.OBSTACLE.value).ravel()
+
+        trans = np.empty((height * width, 5), dtype=np.int64)
+        here = rows * width + cols
+        for k in range(4):
+            nr = rows + _ROW_DELTAS[k]
+            nc = cols + _COL_DELTAS[k]
+            inside = (nr >= 0) & (nr < height) & (nc >= 0) & (nc < width)
+            target = np.where(inside, nr * width + nc, here)
+            trans[:, k] = np.where(blocked[target], here, target)
+        trans[:, _STAY_INDEX] = here
+
+        self._trans: npt.NDArray[np.int64] = trans
+        self._hazard: npt.NDArray[np.bool_] = (kinds == Cell.HAZARD.value).ravel()
+        self._goal: npt.NDArray[np.bool_] = (kinds == Cell.GOAL.value).ravel()
+
+    def _slipped(
+        self, intended: npt.NDArray[np.int64], u: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.int64]:
+        half = self.slip / 2
+        turn = np.where(u < half, 1, np.where(u < self.slip, 3, 0))
+        moving = intended != _STAY_INDEX
+        out: npt.NDArray[np.int64] = np.where(moving, (intended + turn) % 4, intended)
+        return out
+
+    def step(
+        self, pos: Tuple[int, int], action: Action, rng: np.random.Generator
+    ) -> Tuple[int, int]:
+        """Sample the position reached by taking action at pos."""
+        width = self.env.width
+        intended = np.array([_DIRECTIONS.index(action)], dtype=np.int64)
+        actual = int(self._slipped(intended, rng.random(1))[0])
+        r, c = divmod(int(self._trans[pos[0] * width + pos[1], actual]), width)
+        return (r, c)
+
+
+def estimate_safety(
+    controller: ReductionController,
+    env: Environment,
+    max_steps: int,
+    slip: float,
+    seed: int = 0,
+    episodes: int = 1_000_000,
+    batch: int = 65_536,
+    target_width: Optional[float] = None,
+    confidence: float = 0.95,
+) -> SafetyEstimate:
+    """Estimate how often the controller stays safe and succeeds under slip.
+
+    The machine is simulated once to pick the policy, which is tabulated per
+    cell. Episodes then run in NumPy batches; each batch advances every live
+    episode one tick at a time. An episode ends when it lands on the goal or
+    after max_steps ticks and is unsafe if it ever lands on a hazard.
+
+    If target_width is given, sampling stops after the first batch at which
+    both Wilson intervals are no wider than it. The run is reproducible for a
+    given seed and batch size.
+    """
+    if max_steps <= 0:
+        raise ValueError("max_steps must be positive")
+    if episodes <= 0 or batch <= 0:
+        raise ValueError("episodes and batch must be positive")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be in (0, 1)")
+
+    dynamics = SlipperyDynamics(env, slip)
+    width = env.width
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    halted = controller.machine.simulate(controller.bound) is not None
+    policy = np.full(env.height * width, _STAY_INDEX, dtype=np.int64)
+    if halted:
+        for p in range(env.height * width):
+            code = _policy_code(env, *divmod(p, width))
+            policy[p] = _STAY_INDEX if code < 0 else code & 3
+
+    start = env.start[0] * width + env.start[1]
+    start_safe = not bool(dynamics._hazard[start])
+    rng = np.random.default_rng(seed)
+
+    runs = safe_hits = success_hits = 0
+    safety = success = Estimate.wilson(0, 0, z)
+    while runs < episodes:
+        n = min(batch, episodes - runs)
+        safe = np.full(n, start_safe, dtype=bool)
+        reached = np.zeros(n, dtype=bool)
+        live = np.arange(n)
+        here = np.full(n, start, dtype=np.int64)
+
+        for _ in range(max_steps):
+            if live.size == 0:
+                break
+            actual = dynamics._slipped(policy[here], rng.random(live.size))
+            here = dynamics._trans[here, actual]
+            safe[live] &= ~dynamics._hazard[here]
+            hit = dynamics._goal[here]
+            reached[live[hit]] = True
+            live = live[~hit]
+            here = here[~hit]
+
+        runs += n
+        safe_hits += int(safe.sum())
+        success_hits += int(reached.sum())
+        safety = Estimate.wilson(safe_hits, runs, z)
+        success = Estimate.wilson(success_hits, runs, z)
+        if target_width is not None and max(safety.width, success.width) <= target_width:
+            break
+
+    return SafetyEstimate(episodes=runs, safety=safety, success=success)
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import partial
+from typing import Callable, List, Optional, Tuple
 
-from .controller import Action, ControllerResult, step
-from .environment import Environment
+from .budget import Budget, BudgetMeter
+from .controller import Action, ControllerResult
+from .environment import Cell, Environment
 from .machine import Machine
 
+# Goal-seeking preference order with the matching row and column offsets.
+_POLICY_ORDER = (Action.RIGHT, Action.DOWN, Action.LEFT, Action.UP)
+_ROW_DELTAS = (0, 1, 0, -1)
+_COL_DELTAS = (1, 0, -1, 0)
 
-@dataclass(frozen=True)
+# Policy codes: 0-3 move in _POLICY_ORDER, 4-7 move onto the goal, _STAY stays put.
+_GOAL_CODE = 4
+_STAY = -1
+
+# Preallocated results so the policy never builds a new ControllerResult.
+_MOVE_RESULTS = tuple(ControllerResult(action=a, success_signal=False) for a in _POLICY_ORDER)
+_GOAL_RESULTS = tuple(ControllerResult(action=a, success_signal=True) for a in _POLICY_ORDER)
+_STAY_RESULT = ControllerResult(action=Action.STAY, success_signal=False)
+
+
+@dataclass(frozen=True, slots=True)
 class ReductionController:
     """A bounded reduction-style controller.
 
@@ -21,7 +37,7 @@ class ReductionController:
     bound: int
 
     def run_episode(
-        self, env: Environment, max_steps: int
+        self, env: Environment, max_steps: int, budget: Optional[Budget] = None
     ) -> Tuple[bool, bool, List[Tuple[int, int]]]:
         """Run a single episode.
 
@@ -29,55 +45,171 @@ class ReductionController:
         safe is True iff the agent never enters a hazard cell.
         success is True iff the agent reaches the goal.
         trace is the list of visited positions including the initial position.
+
+        If budget runs out first, DeadlineExceeded is raised with partial set to
+        the (safe, success, trace) observed so far. If it runs out during the
+        machine simulation, the error from Machine.simulate propagates.
         """
         if max_steps <= 0:
             raise ValueError("max_steps must be positive")
 
-        halted = self.machine.simulate(self.bound) is not None
-        pos = env.start
-        safe = not env.is_hazard(*pos)
-        trace: List[Tuple[int, int]] = [pos]
-        success = False
+        halted = self.machine.simulate(self.bound, budget) is not None
+        start = env.start
 
-        for _ in range(max_steps):
-            if halted:
-                result = self._good_policy(env, pos)
-            else:
-                result = ControllerResult(action=Action.STAY, success_signal=False)
-
-            pos = step(pos, result.action)
-            trace.append(pos)
+        # Neither policy ever moves into a hazard, so safety is decided by the start cell.
+        safe = not env.is_hazard(*start)
 
-            if env.is_hazard(*pos):
-                safe = False
-
-            if result.success_signal:
-                success = True
-                break
+        if not halted:
+            return safe, False, [start] * (max_steps + 1)
 
+        meter = budget.start() if budget is not None else None
+        success, trace = self._goal_seeking_trace(env, max_steps, meter)
+        if meter is not None and not success and len(trace) <= max_steps:
+            raise meter.exceeded(steps=len(trace) - 1, partial=(safe, success, trace))
         return safe, success, trace
 
     @staticmethod
-    def _good_policy(env: Environment, pos: Tuple[int, int]) -> ControllerResult:
-        r, c = pos
-        candidates = [Action.RIGHT, Action.DOWN, Action.LEFT, Action.UP]
-
-        safe_actions: List[Action] = []
-        for act in candidates:
-            nr, nc = step((r, c), act)
-            if not env.in_bounds(nr, nc):
-                continue
-            if env.is_blocked(nr, nc):
-                continue
-            if env.is_hazard(nr, nc):
-                continue
-
-            if env.is_goal(nr, nc):
-                return ControllerResult(action=act, success_signal=True)
+    def _goal_seeking_trace(
+        env: Environment,
+        max_steps: int,
+        meter: Optional[BudgetMeter] = None,
+        fill_cycle: bool = True,
+    ) -> Tuple[bool, List[Tuple[int, int]]]:
+        """Roll out the goal-seeking policy for up to max_steps ticks.
+
+        On grid-backed worlds the policy reads env.grid rows directly (see
+        _grid_policy); other worlds go through env.at. Nothing is prepared up
+        front, so the cost follows the ticks actually taken.
+
+        The policy is deterministic and depends only on the current cell, so
+        the trajectory ends in a cycle. Brent's method finds it without
+        remembering visited cells: the position at each power-of-two tick is
+        kept, and meeting it again closes a cycle. The rest of the trace is
+        then filled by repeating that cycle instead of re-evaluating the
+        policy. Without fill_cycle the trace instead ends where the cycle was
+        found.
+
+        The meter is consulted every check_every ticks. When it asks to stop,
+        the trace is returned early, shorter than max_steps + 1.
+        """
+        policy = _grid_policy(env) if env.grid else partial(_policy_code, env)
+        r, c = env.start
+        trace: List[Tuple[int, int]] = [env.start]
+        saved, saved_at, next_save = env.start, 0, 1
+        check_every = meter.budget.check_every if meter is not None else max_steps + 1
+        next_check = check_every
+
+        for i in range(1, max_steps + 1):
+            if i == next_check:
+                assert meter is not None
+                if meter.should_stop(i - 1):
+                    return False, trace
+                next_check += check_every
+
+            code = policy(r, c)
+            if code != _STAY:
+                # Odd directions (DOWN, UP) move along rows, even ones along columns.
+                # Touching only that coordinate saves allocating an int per tick.
+                k = code & 3
+                if k & 1:
+                    r += _ROW_DELTAS[k]
+                else:
+                    c += _COL_DELTAS[k]
+                pos = (r, c)
+                trace.append(pos)
+                if code >= _GOAL_CODE:
+                    return True, trace
+            else:
+                # Staying put is a cycle of one tick, closed at once.
+                trace.append(trace[-1])
+                if fill_cycle:
+                    _repeat_cycle(trace, i - 1, max_steps - i)
+                return False, trace
 
-            safe_actions.append(act)
+            if pos == saved:
+                if fill_cycle:
+                    _repeat_cycle(trace, saved_at, max_steps - i)
+                return False, trace
+            if i == next_save:
+                saved, saved_at, next_save = pos, i, 2 * i
 
-        if safe_actions:
-            return ControllerResult(action=safe_actions[0], success_signal=False)
+        return False, trace
 
-        return ControllerResult(action=Action.STAY, success_signal=False)
+    @staticmethod
+    def _good_policy(env: Environment, pos: Tuple[int, int]) -> ControllerResult:
+        code = _policy_code(env, *pos)
+        if code == _STAY:
+            return _STAY_RESULT
+        if code >= _GOAL_CODE:
+            return _GOAL_RESULTS[code - _GOAL_CODE]
+        return _MOVE_RESULTS[code]
+
+
+def _policy_code(env: Environment, r: int, c: int) -> int:
+    """Return the goal-seeking decision at (r, c) as a policy code."""
+    first_safe = _STAY
+    for k in range(4):
+        nr = r + _ROW_DELTAS[k]
+        nc = c + _COL_DELTAS[k]
+        if not env.in_bounds(nr, nc):
+            continue
+
+        cell = env.at(nr, nc)
+        if cell == Cell.OBSTACLE or cell == Cell.HAZARD:
+            continue
+        if cell == Cell.GOAL:
+            return k + _GOAL_CODE
+        if first_safe == _STAY:
+            first_safe = k
+
+    return first_safe
+
+
+def _grid_policy(env: Environment) -> Callable[[int, int], int]:
+    """Return _policy_code for env, reading its grid rows directly.
+
+    Cells are compared by identity and the four edge tests replace in_bounds,
+    so a decision costs a few list reads and no method calls.
+    """
+    grid = env.grid
+    last_row, last_col = env.height - 1, env.width - 1
+    empty, goal = Cell.EMPTY, Cell.GOAL
+
+    def code(r: int, c: int) -> int:
+        row = grid[r]
+        first_safe = _STAY
+        if c < last_col:
+            cell = row[c + 1]
+            if cell is goal:
+                return _GOAL_CODE
+            if cell is empty:
+                first_safe = 0
+        if r < last_row:
+            cell = grid[r + 1][c]
+            if cell is goal:
+                return _GOAL_CODE + 1
+            if cell is empty and first_safe == _STAY:
+                first_safe = 1
+        if c > 0:
+            cell = row[c - 1]
+            if cell is goal:
+                return _GOAL_CODE + 2
+            if cell is empty and first_safe == _STAY:
+                first_safe = 2
+        if r > 0:
+            cell = grid[r - 1][c]
+            if cell is goal:
+                return _GOAL_CODE + 3
+            if cell is empty and first_safe == _STAY:
+                first_safe = 3
+        return first_safe
+
+    return code
+
+
+def _repeat_cycle(trace: List[Tuple[int, int]], j: int, remaining: int) -> None:
+    """Extend trace by remaining ticks of the cycle that returns to trace[j]."""
+    period = trace[j + 1 :]
+    reps, rem = divmod(remaining, len(period))
+    trace.extend(period * reps)
+    trace.extend(period[:rem])
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from types import TracebackType
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from .environment import Cell, Environment
+from .reduction import ReductionController
+
+_CELL_BY_BYTE: Dict[int, Cell] = {ord(cell.value): cell for cell in Cell}
+
+
+@dataclass(frozen=True, slots=True)
+class EnvironmentHandle:
+    """A small, picklable reference to an environment in shared memory."""
+
+    name: str
+    shape: Tuple[int, int]
+    start: Tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class SharedEnvironment(Environment):
+    """A read-only Environment viewing one byte per cell in shared memory.
+
+    Cells are stored row-major as their single-character values. The view is
+    zero-copy: attaching maps the segment, it does not rebuild a grid. grid is
+    left empty.
+    """
+
+    grid: List[List[Cell]] = field(default_factory=list, init=False, repr=False, compare=False)
+    shape: Tuple[int, int]
+    cells: memoryview = field(repr=False, compare=False)
+
+    @classmethod
+    def from_strings(cls, rows: Iterable[str], start: Tuple[int, int]) -> SharedEnvironment:
+        raise TypeError(
+            "SharedEnvironment views shared memory and cannot be built from strings; "
+            "build an Environment and use SharedEnvironments.publish and attach"
+        )
+
+    @property
+    def height(self) -> int:
+        return self.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.shape[1]
+
+    def at(self, r: int, c: int) -> Cell:
+        if not self.in_bounds(r, c):
+            raise IndexError("out of bounds")
+        return _CELL_BY_BYTE[self.cells[r * self.shape[1] + c]]
+
+
+class SharedEnvironments:
+    """Owner of shared-memory segments for published environments.
+
+    Use it as a context manager around the process pool, outermost, so the
+    pool shuts down first and every segment is unlinked afterwards:
+
+        with SharedEnvironments() as shared, ProcessPoolExecutor() as pool:
+            handle = shared.publish(env)
+            pool.submit(run_shared_episode, controller, handle, max_steps)
+    """
+
+    def __init__(self) -> None:
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+
+    def publish(self, env: Environment) -> EnvironmentHandle:
+        """Copy env into a new shared segment once and return its handle."""
+        height, width = env.height, env.width
+        data = "".join(env.at(r, c).value for r in range(height) for c in range(width))
+        shm = shared_memory.SharedMemory(create=True, size=height * width)
+        buf = shm.buf
+        assert buf is not None
+        buf[: height * width] = data.encode("ascii")
+        self._segments[shm.name] = shm
+        return EnvironmentHandle(name=shm.name, shape=(height, width), start=env.start)
+
+    def close(self) -> None:
+        """Release and unlink every segment published by this owner."""
+        for shm in self._segments.values():
+            shm.close()
+            shm.unlink()
+        self._segments.clear()
+
+    def __enter__(self) -> SharedEnvironments:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+# Per-process attachments, so repeated tasks on one handle map it only once.
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, SharedEnvironment]] = {}
+
+
+def attach(handle: EnvironmentHandle) -> SharedEnvironment:
+    """Return a read-only view of a published environment in this process."""
+    hit = _attached.get(handle.name)
+    if hit is not None:
+        return hit[1]
+
+    shm = shared_memory.SharedMemory(name=handle.name)
+    height, width = handle.shape
+    buf = shm.buf
+    assert buf is not None
+    view = buf[: height * width].toreadonly()
+    env = SharedEnvironment(start=handle.start, shape=handle.shape, cells=view)
+    _attached[handle.name] = (shm, env)
+    return env
+
+
+def detach_all() -> None:
+    """Drop every attachment made by this process. Runs at interpreter exit."""
+    for shm, env in _attached.values():
+        env.cells.release()
+        shm.close()
+    _attached.clear()
+
+
+atexit.register(detach_all)
+
+
+def run_shared_episode(
+    controller: ReductionController, handle: EnvironmentHandle, max_steps: int
+) -> Tuple[bool, bool, List[Tuple[int, int]]]:
+    """Process-pool task: run an episode on a published environment."""
+    return controller.run_episode(attach(handle), max_steps=max_steps)
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from .cli import build_default_environment
+from .machine import Machine, MachineProgram
+from .reduction import ReductionController
+
+ConfigKey = Tuple[str, int, int, int, str]
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class SweepConfig:
+    """One point of the sweep space."""
+
+    program: str
+    x: int
+    bound: int
+    max_steps: int
+    preset: str
+
+    @property
+    def cost(self) -> int:
+        """Estimated relative cost of running this configuration."""
+        return self.bound + self.max_steps
+
+    @property
+    def key(self) -> ConfigKey:
+        return (self.program, self.x, self.bound, self.max_steps, self.preset)
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    config: SweepConfig
+    safe: bool
+    success: bool
+    steps: int
+
+    def to_json(self) -> str:
+        record = asdict(self.config)
+        record.update(safe=self.safe, success=self.success, steps=self.steps)
+        return json.dumps(record, sort_keys=True)
+
+    @staticmethod
+    def from_json(line: str) -> SweepResult:
+        record = json.loads(line)
+        config = SweepConfig(
+            program=str(record["program"]),
+            x=int(record["x"]),
+            bound=int(record["bound"]),
+            max_steps=int(record["max_steps"]),
+            preset=str(record["preset"]),
+        )
+        return SweepResult(
+            config=config,
+            safe=bool(record["safe"]),
+            success=bool(record["success"]),
+            steps=int(record["steps"]),
+        )
+
+
+def configurations(
+    programs: Iterable[str],
+    xs: Iterable[int],
+    bounds: Iterable[int],
+    max_steps: Iterable[int],
+    presets: Iterable[str],
+) -> List[SweepConfig]:
+    """Return the sorted, deduplicated cartesian product of the given axes."""
+    product = itertools.product(programs, xs, bounds, max_steps, presets)
+    return sorted({SweepConfig(*point) for point in product})
+
+
+def shard(configs: Sequence[SweepConfig], index: int, count: int) -> List[SweepConfig]:
+    """Return the configurations assigned to shard index of count.
+
+    Configurations are dealt most expensive first to the currently lightest
+    shard (ties go to the lower shard index). The assignment depends only on
+    the configuration set, so every node computes the same partition.
+    """
+    if count <= 0:
+        raise ValueError("shard count must be positive")
+    if not 0 <= index < count:
+        raise ValueError("shard index must be in [0, count)")
+
+    loads: List[Tuple[int, int]] = [(0, i) for i in range(count)]
+    mine: List[SweepConfig] = []
+    for config in sorted(configs, key=lambda cfg: (-cfg.cost, cfg.key)):
+        load, owner = heapq.heappop(loads)
+        if owner == index:
+            mine.append(config)
+        heapq.heappush(loads, (load + config.cost, owner))
+    return sorted(mine)
+
+
+def run_config(config: SweepConfig) -> SweepResult:
+    env = build_default_environment(config.preset)
+    m = Machine(program=MachineProgram(config.program), x=config.x)
+    rc = ReductionController(machine=m, bound=config.bound)
+    safe, success, trace = rc.run_episode(env, max_steps=config.max_steps)
+    return SweepResult(config=config, safe=safe, success=success, steps=len(trace) - 1)
+
+
+def load_results(path: str) -> List[SweepResult]:
+    """Read a result file without modifying it.
+
+    A final line without a newline is a record still being written, or one
+    torn by an interrupted write, and is skipped. Any other line that does not
+    parse raises ValueError naming the file and line.
+    """
+    return _read_results(path)[0]
+
+
+def _read_results(path: str) -> Tuple[List[SweepResult], int]:
+    """Return the records of path and the byte length of its complete lines."""
+    if not os.path.exists(path):
+        return [], 0
+
+    results: List[SweepResult] = []
+    complete = 0
+    with open(path, "rb") as f:
+        for lineno, raw in enumerate(f, start=1):
+            if not raw.endswith(b"\n"):
+                break
+            try:
+                results.append(SweepResult.from_json(raw.decode("utf-8")))
+            except (ValueError, KeyError, TypeError) as exc:
+                raise ValueError(f"{path}:{lineno}: malformed result line: {exc}") from exc
+            complete += len(raw)
+    return results, complete
+
+
+def run_shard(configs: Sequence[SweepConfig], out_path: str) -> List[SweepResult]:
+    """Run configs, appending each result to out_path as one JSON line.
+
+    Every line is flushed as soon as its configuration finishes, so the file
+    is the checkpoint: rerunning with the same arguments skips configurations
+    already recorded and resumes with the rest. A torn final line left by an
+    interrupted write is cut off before appending.
+    """
+    results, complete = _read_results(out_path)
+    if os.path.exists(out_path) and os.path.getsize(out_path) != complete:
+        with open(out_path, "r+b") as f:
+            f.truncate(complete)
+    done: Set[ConfigKey] = {r.config.key for r in results}
+
+    with open(out_path, "a", encoding="utf-8") as out:
+        for config in configs:
+            if config.key in done:
+                continue
+            result = run_config(config)
+            out.write(result.to_json() + "\n")
+            out.flush()
+            results.append(result)
+            done.add(config.key)
+    return results
+
+
+def merge_results(paths: Iterable[str]) -> Tuple[List[SweepResult], int]:
+    """Combine result files into one list sorted by configuration.
+
+    Returns (results, duplicates). Records repeated across files are dropped;
+    a configuration recorded with two different outcomes raises ValueError.
+    The input files are only read, so a shard still being written is safe to
+    merge; its unfinished last line is left out.
+    """
+    merged: Dict[ConfigKey, SweepResult] = {}
+    duplicates = 0
+    for path in paths:
+        for result in load_results(path):
+            seen = merged.get(result.config.key)
+            if seen is None:
+                merged[result.config.key] = result
+            elif seen == result:
+                duplicates += 1
+            else:
+                raise ValueError(f"conflicting results for {result.config.key!r}")
+    return [merged[k] for k in sorted(merged)], duplicates
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    index, sep, count = text.partition("/")
+    if not sep:
+        raise argparse.ArgumentTypeError("shard must look like i/N")
+    try:
+        return int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError("shard must look like i/N") from None
+
+
+def parse_int_axis(values: Sequence[str]) -> List[int]:
+    """Expand integers and start:stop[:step] ranges into a list of ints."""
+    out: List[int] = []
+    for value in values:
+        if ":" in value:
+            out.extend(range(*(int(part) for part in value.split(":"))))
+        else:
+            out.append(int(value))
+    return out
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="autonomy-sweep", add_help=True)
+    sub = p.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run")
+    run.add_argument("--program", nargs="+", choices=["halt", "loop"], default=["halt", "loop"])
+    run.add_argument("--x", nargs="+", default=["10"])
+    run.add_argument("--bound", nargs="+", default=["200"])
+    run.add_argument("--max-steps", nargs="+", default=["60"])
+    run.add_argument("--preset", nargs="+", choices=["default", "open"], default=["default"])
+    run.add_argument("--shard", type=parse_shard, default=(0, 1))
+    run.add_argument("--out", required=True)
+
+    merge = sub.add_parser("merge")
+    merge.add_argument("--out", required=True)
+    merge.add_argument("inputs", nargs="+")
+
+    return p.parse_args(list(argv))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == "run":
+        configs = configurations(
+            args.program,
+            parse_int_axis(args.x),
+            parse_int_axis(args.bound),
+            parse_int_axis(args.max_steps),
+            args.preset,
+        )
+        index, count = args.shard
+        results = run_shard(shard(configs, index, count), args.out)
+        print(f"shard={index}/{count}")
+        print(f"configs={len(results)}")
+        return 0
+
+    results, duplicates = merge_results(args.inputs)
+    with open(args.out, "w", encoding="utf-8") as out:
+        for result in results:
+            out.write(result.to_json() + "\n")
+
+    print(f"configs={len(results)}")
+    print(f"duplicates={duplicates}")
+    print(f"safe={sum(r.safe for r in results)}")
+    print(f"success={sum(r.success for r in results)}")
+    print(f"steps={sum(r.steps for r in results)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from .environment import Environment
+from .machine import Machine
+from .reduction import ReductionController
+
+
+def critical_bound(machine: Machine, limit: int) -> Optional[int]:
+    """Smallest simulation bound at which the machine is seen to halt.
+
+    This is the bound at which ReductionController switches from the inert
+    policy to the goal-seeking one. Halting within B steps implies halting
+    within any larger bound, and the halting step count is that smallest B,
+    so one simulation up to limit answers exactly. Returns None if the machine
+    does not halt within limit steps.
+    """
+    if limit < 0:
+        raise ValueError("limit must be nonnegative")
+
+    result, steps = machine.run(limit)
+    return steps if result is not None else None
+
+
+def critical_max_steps(
+    controller: ReductionController, env: Environment, limit: int
+) -> Optional[int]:
+    """Smallest episode limit at which the controller reaches the goal.
+
+    The machine is simulated once. If it does not halt within the controller's
+    bound the inert policy never succeeds. Otherwise the goal-seeking policy is
+    rolled out once for up to limit ticks. The episode stops on the tick it
+    reaches the goal, so its trace length is the threshold. A rollout that
+    closes a cycle of the deterministic policy can never succeed and stops
+    there. Returns None if the goal is not reached within limit ticks.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+
+    if controller.machine.simulate(controller.bound) is None:
+        return None
+
+    success, trace = ReductionController._goal_seeking_trace(env, limit, fill_cycle=False)
+    return len(trace) - 1 if success else None
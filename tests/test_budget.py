@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from computational_autonomy.budget import Budget, CancellationToken, DeadlineExceeded, Progress
+from computational_autonomy.environment import Environment
+from computational_autonomy.machine import Machine, MachineProgram
+from computational_autonomy.reduction import ReductionController
+
+
+def _long_corridor(width: int) -> Environment:
+    return Environment.from_strings(["." * width], start=(0, 0))
+
+
+def test_budget_rejects_nonpositive_check_interval() -> None:
+    with pytest.raises(ValueError):
+        _ = Budget(check_every=0)
+
+
+def test_simulate_raises_when_already_cancelled() -> None:
+    token = CancellationToken()
+    token.cancel()
+    m = Machine(program=MachineProgram.HALT, x=3)
+
+    with pytest.raises(DeadlineExceeded) as excinfo:
+        m.simulate(10, Budget(token=token))
+
+    assert excinfo.value.cancelled is True
+    assert excinfo.value.partial == (3,)
+
+
+def test_simulate_raises_when_deadline_has_passed() -> None:
+    m = Machine(program=MachineProgram.LOOP, x=0)
+
+    with pytest.raises(DeadlineExceeded) as excinfo:
+        m.simulate(10, Budget(deadline=time.monotonic() - 1))
+
+    assert excinfo.value.cancelled is False
+    assert excinfo.value.steps == 0
+
+
+def test_run_episode_returns_partial_trace_when_cancelled() -> None:
+    env = _long_corridor(5000)
+    rc = ReductionController(machine=Machine(MachineProgram.HALT, x=0), bound=5)
+    token = CancellationToken()
+    budget = Budget(
+        token=token,
+        progress=lambda p: token.cancel() if p.steps > 0 else None,
+        check_every=100,
+        progress_every=0.0,
+    )
+
+    with pytest.raises(DeadlineExceeded) as excinfo:
+        rc.run_episode(env, max_steps=10_000, budget=budget)
+
+    err = excinfo.value
+    assert err.cancelled is True
+    assert err.steps == 199
+    assert err.partial == (True, False, [(0, c) for c in range(200)])
+
+
+def test_run_episode_reports_progress_and_completes_within_budget() -> None:
+    env = _long_corridor(50)
+    rc = ReductionController(machine=Machine(MachineProgram.HALT, x=0), bound=5)
+    reports: list[Progress] = []
+    deadline = Budget.within(3600).deadline
+    budget = Budget(deadline=deadline, progress=reports.append, check_every=10, progress_every=0.0)
+
+    safe, success, trace = rc.run_episode(env, max_steps=200, budget=budget)
+
+    assert (safe, success) == (True, False)
+    assert len(trace) == 201
+    # The walk bounces at the far end; that cycle is confirmed at tick 66.
+    assert [p.steps for p in reports] == [0, 9, 19, 29, 39, 49, 59]
+    assert all(p.steps_per_sec >= 0 for p in reports)
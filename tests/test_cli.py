@@ -16,6 +16,8 @@ def test_parse_args_minimal() -> None:
     assert args.bound == 200
     assert args.max_steps == 60
     assert args.render is False
+    assert args.sparse is False
+    assert args.search is None
 
 
 def test_parse_args_all_values() -> None:
@@ -133,3 +135,44 @@ def test_build_default_environment_unknown_preset_rejected() -> None:
 
     with pytest.raises(ValueError):
         _ = build_default_environment("unknown")
+
+
+def test_build_default_environment_sparse_matches_dense() -> None:
+    from computational_autonomy.cli import build_default_environment
+    from computational_autonomy.environment import SparseEnvironment
+
+    dense = build_default_environment("default")
+    sparse = build_default_environment("default", sparse=True)
+
+    assert isinstance(sparse, SparseEnvironment)
+    assert sparse.render(sparse.start) == dense.render(dense.start)
+
+
+def test_main_sparse_prints_summary(capsys: pytest.CaptureFixture[str]) -> None:
+    from computational_autonomy.cli import main
+
+    rc = main(["--preset", "open", "--program", "halt", "--x", "0", "--sparse"])
+    assert rc == 0
+
+    out = capsys.readouterr().out
+    assert "success=True" in out
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["--program", "halt", "--x", "12", "--search", "bound"], "critical_bound=12"),
+        (["--program", "loop", "--search", "bound"], "critical_bound=None"),
+        (
+            ["--preset", "open", "--program", "halt", "--x", "0", "--search", "max-steps"],
+            "critical_max_steps=8",
+        ),
+    ],
+)
+def test_main_search_prints_threshold(
+    argv: list[str], expected: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from computational_autonomy.cli import main
+
+    assert main(argv) == 0
+    assert capsys.readouterr().out.strip() == expected
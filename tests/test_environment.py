@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from computational_autonomy.environment import Cell, Environment
+from computational_autonomy.environment import Cell, Environment, SparseEnvironment
 
 
 def test_from_strings_and_access() -> None:
@@ -48,3 +48,40 @@ def test_from_strings_rejects_nonrectangular_rows() -> None:
 def test_from_strings_rejects_start_out_of_bounds() -> None:
     with pytest.raises(ValueError):
         _ = Environment.from_strings([".."], start=(0, 2))
+
+
+def test_sparse_environment_matches_dense_lookups_and_render() -> None:
+    rows = ["..X..", ".H.X.", "..X..", ".X..G", "....."]
+    dense = Environment.from_strings(rows, start=(0, 0))
+    sparse = SparseEnvironment.from_strings(rows, start=(0, 0))
+
+    assert (sparse.height, sparse.width) == (dense.height, dense.width)
+    assert len(sparse.cells) == 6
+    for r in range(dense.height):
+        for c in range(dense.width):
+            assert sparse.at(r, c) == dense.at(r, c)
+    assert sparse.render((2, 1)) == dense.render((2, 1))
+
+    with pytest.raises(IndexError):
+        _ = sparse.at(5, 0)
+
+
+def test_sparse_environment_from_cells_supports_huge_worlds() -> None:
+    n = 10**6
+    env = SparseEnvironment.from_cells(
+        (n, n), {(n - 1, n - 1): Cell.GOAL, (3, 4): Cell.HAZARD}, start=(n - 1, n - 3)
+    )
+
+    assert env.is_goal(n - 1, n - 1)
+    assert env.is_hazard(3, 4)
+    assert env.at(123_456, 654_321) == Cell.EMPTY
+    assert env.in_bounds(n - 1, 0) and not env.in_bounds(n, 0)
+
+
+def test_sparse_environment_from_cells_rejects_bad_input() -> None:
+    with pytest.raises(ValueError):
+        _ = SparseEnvironment.from_cells((0, 3), {}, start=(0, 0))
+    with pytest.raises(ValueError):
+        _ = SparseEnvironment.from_cells((2, 2), {(2, 0): Cell.GOAL}, start=(0, 0))
+    with pytest.raises(ValueError):
+        _ = SparseEnvironment.from_cells((2, 2), {}, start=(0, 2))
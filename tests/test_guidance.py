@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from computational_autonomy.environment import Cell, Environment, MutableEnvironment
+from computational_autonomy.guidance import DistanceField
+
+
+def _distances(field: DistanceField) -> list[list[int | None]]:
+    env = field.env
+    return [[field.distance(r, c) for c in range(env.width)] for r in range(env.height)]
+
+
+def test_distance_field_counts_safe_moves_to_nearest_goal() -> None:
+    env = Environment.from_strings(
+        [
+            "...",
+            ".HG",
+            "X..",
+            "X.X",
+            "H.X",
+        ],
+        start=(0, 0),
+    )
+    field = DistanceField(env)
+
+    assert _distances(field) == [
+        [3, 2, 1],
+        [4, None, 0],
+        [None, 2, 1],
+        [None, 3, None],
+        [None, 4, None],
+    ]
+
+    with pytest.raises(IndexError):
+        _ = field.distance(5, 0)
+
+
+def test_distance_field_repairs_match_full_rebuild_under_random_edits() -> None:
+    rng = random.Random(1234)
+    rows = ["".join(rng.choice("....XH") for _ in range(12)) for _ in range(9)]
+    env = MutableEnvironment.from_strings(rows, start=(0, 0))
+    env.set_cell(4, 6, Cell.GOAL)
+    field = DistanceField(env)
+
+    for _ in range(300):
+        r, c = rng.randrange(env.height), rng.randrange(env.width)
+        env.set_cell(r, c, rng.choice(list(Cell)))
+
+        rebuilt = DistanceField(Environment(grid=env.grid, start=env.start))
+        assert _distances(field) == _distances(rebuilt)
+
+
+def test_distance_field_repair_touches_only_the_affected_region() -> None:
+    env = MutableEnvironment.from_strings(["." * 200 for _ in range(200)], start=(0, 0))
+    env.set_cell(0, 0, Cell.GOAL)
+    field = DistanceField(env)
+
+    env.set_cell(199, 199, Cell.OBSTACLE)
+    assert field.repaired_cells == 1
+    assert field.distance(199, 198) == 397
+
+    env.set_cell(199, 199, Cell.EMPTY)
+    assert field.repaired_cells == 1
+    assert field.distance(199, 199) == 398
+
+    field.detach()
+    env.set_cell(0, 1, Cell.GOAL)
+    assert field.distance(0, 2) == 2
+
+
+def test_mutable_environment_set_cell_notifies_listeners() -> None:
+    env = MutableEnvironment.from_strings(["..", ".."], start=(0, 0))
+    seen: list[tuple[int, int, Cell, Cell]] = []
+    env.subscribe(lambda r, c, old, new: seen.append((r, c, old, new)))
+
+    assert env.set_cell(1, 1, Cell.GOAL) == Cell.EMPTY
+    assert env.set_cell(1, 1, Cell.GOAL) == Cell.GOAL
+    assert env.is_goal(1, 1)
+    assert seen == [(1, 1, Cell.EMPTY, Cell.GOAL)]
+
+    with pytest.raises(IndexError):
+        env.set_cell(2, 0, Cell.HAZARD)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import random
+
 import pytest
 
-from computational_autonomy.machine import Machine, MachineProgram
+from computational_autonomy.machine import CounterProgram, Instruction, Machine, MachineProgram, Op
 
 
 def test_loop_never_halts_within_any_bound() -> None:
@@ -25,3 +27,76 @@ def test_negative_bound_rejected() -> None:
     m = Machine(program=MachineProgram.HALT, x=1)
     with pytest.raises(ValueError):
         _ = m.simulate(-1)
+
+
+def _random_program(rng: random.Random) -> CounterProgram:
+    size, registers = rng.randint(1, 6), rng.randint(1, 3)
+    ops = [Op.INC, Op.DEC, Op.DEC, Op.HALT]
+    code = tuple(
+        Instruction(
+            rng.choice(ops), rng.randrange(registers), rng.randrange(size), rng.randrange(size)
+        )
+        for _ in range(size)
+    )
+    return CounterProgram(code=code, registers=registers)
+
+
+def test_accelerated_simulation_matches_step_by_step() -> None:
+    rng = random.Random(2024)
+    for _ in range(500):
+        program = _random_program(rng)
+        for x in (0, 1, 2, 7, 30):
+            m = Machine(program=program, x=x)
+            for bound in (0, 1, 2, 5, 16, 100):
+                assert m.simulate(bound) == m.simulate(bound, accelerate=False)
+
+
+def test_run_reports_halting_step_count_as_smallest_halting_bound() -> None:
+    rng = random.Random(7)
+    for _ in range(200):
+        program = _random_program(rng)
+        for x in (0, 3, 12):
+            m = Machine(program=program, x=x)
+            result, steps = m.run(100)
+            assert result == m.simulate(100)
+            if result is not None:
+                assert m.simulate(steps) == result
+                assert steps == 0 or m.simulate(steps - 1, accelerate=False) is None
+
+
+def test_transfer_loop_jumps_ahead_with_exact_step_count() -> None:
+    # y += 2 * x one decrement at a time, then return y: 3 steps per unit of x.
+    double = CounterProgram(
+        code=(
+            Instruction(Op.DEC, 0, next_pc=1, zero_pc=3),
+            Instruction(Op.INC, 1, next_pc=2),
+            Instruction(Op.INC, 1, next_pc=0),
+            Instruction(Op.DEC, 1, next_pc=4, zero_pc=5),
+            Instruction(Op.INC, 0, next_pc=3),
+            Instruction(Op.HALT),
+        ),
+        registers=2,
+    )
+    x = 10**15
+    m = Machine(program=double, x=x)
+
+    assert m.simulate(7 * x) == 2 * x
+    assert m.simulate(7 * x - 1) is None
+    assert Machine(program=double, x=5).simulate(35, accelerate=False) == 10
+
+
+def test_huge_inputs_finish_instantly_with_unchanged_verdicts() -> None:
+    x = 10**15
+    assert Machine(MachineProgram.HALT, x=x).simulate(x) == 0
+    assert Machine(MachineProgram.HALT, x=x).simulate(x - 1) is None
+    assert Machine(MachineProgram.LOOP, x=x).simulate(10**18) is None
+    assert Machine(MachineProgram.HALT, x=-4).simulate(0) == 0
+
+
+def test_counter_program_rejects_invalid_code() -> None:
+    with pytest.raises(ValueError):
+        _ = CounterProgram(code=())
+    with pytest.raises(ValueError):
+        _ = CounterProgram(code=(Instruction(Op.INC, 1),))
+    with pytest.raises(ValueError):
+        _ = CounterProgram(code=(Instruction(Op.DEC, 0, next_pc=0, zero_pc=1),))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import numpy as np  # noqa: E402
+
+from computational_autonomy.controller import Action  # noqa: E402
+from computational_autonomy.environment import Environment  # noqa: E402
+from computational_autonomy.machine import Machine, MachineProgram  # noqa: E402
+from computational_autonomy.montecarlo import SlipperyDynamics, estimate_safety  # noqa: E402
+from computational_autonomy.reduction import ReductionController  # noqa: E402
+
+HALTING = ReductionController(machine=Machine(MachineProgram.HALT, x=0), bound=5)
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        ["..X..", ".H.X.", "..X..", ".X..G", "....."],
+        [".....", ".....", ".....", ".....", "....G"],
+        ["H.G"],
+    ],
+)
+def test_zero_slip_matches_deterministic_episode(rows: list[str]) -> None:
+    env = Environment.from_strings(rows, start=(0, 0))
+    safe, success, _ = HALTING.run_episode(env, max_steps=30)
+
+    est = estimate_safety(HALTING, env, max_steps=30, slip=0.0, episodes=1000, batch=300)
+
+    assert est.episodes == 1000
+    assert est.safety.probability == float(safe)
+    assert est.success.probability == float(success)
+
+
+def test_estimates_cover_analytic_probabilities() -> None:
+    # From (0, 0) the policy steps right onto the goal; a slip goes down into
+    # the hazard or up out of bounds (staying put), each with probability 0.1.
+    env = Environment.from_strings([".G", "H."], start=(0, 0))
+
+    est = estimate_safety(
+        HALTING, env, max_steps=1, slip=0.2, seed=7, episodes=200_000, confidence=0.999
+    )
+
+    assert est.safety.low <= 0.9 <= est.safety.high
+    assert est.success.low <= 0.8 <= est.success.high
+    assert est.safety.width < 0.01
+
+    with pytest.raises(ValueError):
+        _ = estimate_safety(HALTING, env, max_steps=1, slip=0.2, confidence=1.0)
+
+
+def test_sampling_stops_early_at_target_width_and_is_seeded() -> None:
+    env = Environment.from_strings([".G", "H."], start=(0, 0))
+    runs = [
+        estimate_safety(HALTING, env, max_steps=3, slip=0.3, seed=11, batch=1000, target_width=0.05)
+        for _ in range(2)
+    ]
+    first, second = runs
+
+    assert first == second
+    assert first.episodes < 1_000_000
+    assert max(first.safety.width, first.success.width) <= 0.05
+
+
+def test_inert_policy_never_succeeds_and_step_is_seeded() -> None:
+    env = Environment.from_strings([".G", "H."], start=(0, 0))
+    looping = ReductionController(machine=Machine(MachineProgram.LOOP, x=0), bound=5)
+
+    est = estimate_safety(looping, env, max_steps=5, slip=0.5, episodes=100)
+    assert est.success.probability == 0.0
+    assert est.safety.probability == 1.0
+
+    dynamics = SlipperyDynamics(env, slip=1.0)
+    assert dynamics.step((0, 0), Action.STAY, np.random.default_rng(0)) == (0, 0)
+    assert dynamics.step((0, 0), Action.RIGHT, np.random.default_rng(0)) in {(0, 0), (1, 0)}
+
+    with pytest.raises(ValueError):
+        _ = SlipperyDynamics(env, slip=1.5)
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import pytest
 
-from computational_autonomy.controller import Action
-from computational_autonomy.environment import Environment
+from computational_autonomy.controller import Action, step
+from computational_autonomy.environment import Cell, Environment, SparseEnvironment
 from computational_autonomy.machine import Machine, MachineProgram
 from computational_autonomy.reduction import ReductionController
 
@@ -125,3 +125,83 @@ def test_good_policy_skips_out_of_bounds_neighbors() -> None:
 
     assert result.action == Action.STAY
     assert result.success_signal is False
+
+
+def _reference_episode(
+    env: Environment, max_steps: int
+) -> tuple[bool, bool, list[tuple[int, int]]]:
+    pos = env.start
+    safe = not env.is_hazard(*pos)
+    trace = [pos]
+    for _ in range(max_steps):
+        result = ReductionController._good_policy(env, pos)
+        pos = step(pos, result.action)
+        trace.append(pos)
+        if env.is_hazard(*pos):
+            safe = False
+        if result.success_signal:
+            return safe, True, trace
+    return safe, False, trace
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        ["..X..", ".H.X.", "..X..", ".X..G", "....."],
+        [".....", ".....", ".....", ".....", "....G"],
+        ["...", ".X.", "..."],
+        ["X.X", "XXX"],
+    ],
+)
+@pytest.mark.parametrize("max_steps", [1, 2, 7, 60, 1001])
+def test_goal_seeking_episode_matches_step_by_step_reference(
+    rows: list[str], max_steps: int
+) -> None:
+    env = Environment.from_strings(rows, start=(0, 0) if rows[0][0] == "." else (0, 1))
+    rc = ReductionController(machine=Machine(MachineProgram.HALT, x=0), bound=5)
+
+    assert rc.run_episode(env, max_steps=max_steps) == _reference_episode(env, max_steps)
+
+
+@pytest.mark.parametrize("max_steps", [1, 3, 50])
+def test_goal_seeking_episode_matches_reference_from_every_start(max_steps: int) -> None:
+    rows = ["..X....", ".X..XG.", "...X...", "X..H.X.", ".X...X.", "...X..."]
+    rc = ReductionController(machine=Machine(MachineProgram.HALT, x=0), bound=5)
+
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(row):
+            if cell == "X":
+                continue
+            env = Environment.from_strings(rows, start=(r, c))
+            assert rc.run_episode(env, max_steps=max_steps) == _reference_episode(env, max_steps)
+
+
+def test_good_policy_returns_preallocated_results() -> None:
+    env = Environment.from_strings(["..", ".G"], start=(0, 0))
+
+    first = ReductionController._good_policy(env, (0, 0))
+    second = ReductionController._good_policy(env, (0, 0))
+
+    assert first is second
+    assert not hasattr(first, "__dict__")
+
+
+def test_reduction_runs_unchanged_on_huge_sparse_world() -> None:
+    n = 10**6
+    env = SparseEnvironment.from_cells(
+        (n, n), {(n - 1, n - 1): Cell.GOAL, (n - 1, n - 4): Cell.OBSTACLE}, start=(n - 3, n - 4)
+    )
+    rc = ReductionController(machine=Machine(MachineProgram.HALT, x=0), bound=5)
+
+    safe, success, trace = rc.run_episode(env, max_steps=10)
+
+    assert safe is True
+    assert success is True
+    assert trace == [
+        (n - 3, n - 4),
+        (n - 3, n - 3),
+        (n - 3, n - 2),
+        (n - 3, n - 1),
+        (n - 2, n - 1),
+        (n - 1, n - 1),
+    ]
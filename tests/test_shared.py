@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from computational_autonomy.cli import build_default_environment
+from computational_autonomy.machine import Machine, MachineProgram
+from computational_autonomy.reduction import ReductionController
+from computational_autonomy.shared import (
+    SharedEnvironment,
+    SharedEnvironments,
+    attach,
+    detach_all,
+    run_shared_episode,
+)
+
+
+def test_published_environment_is_a_read_only_view() -> None:
+    env = build_default_environment("default")
+
+    with SharedEnvironments() as shared:
+        handle = shared.publish(env)
+        view = attach(handle)
+
+        assert attach(handle) is view
+        assert len(pickle.dumps(handle)) < 200
+        assert (view.height, view.width, view.start) == (env.height, env.width, env.start)
+        assert view.render((2, 1)) == env.render((2, 1))
+        with pytest.raises(TypeError):
+            view.cells[0] = ord("H")
+        with pytest.raises(IndexError):
+            _ = view.at(5, 0)
+
+        detach_all()
+
+
+def test_shared_environment_cannot_be_built_from_strings() -> None:
+    with pytest.raises(TypeError, match="SharedEnvironments.publish"):
+        _ = SharedEnvironment.from_strings(["."], start=(0, 0))
+
+
+def test_segments_are_released_on_close() -> None:
+    env = build_default_environment("open")
+    with SharedEnvironments() as shared:
+        handle = shared.publish(env)
+
+    with pytest.raises(FileNotFoundError):
+        _ = attach(handle)
+
+
+def test_process_pool_runs_episodes_on_shared_environment() -> None:
+    env = build_default_environment("default")
+    controllers = [
+        ReductionController(machine=Machine(program, x=x), bound=5)
+        for program in MachineProgram
+        for x in (0, 3, 10)
+    ]
+
+    with SharedEnvironments() as shared, ProcessPoolExecutor(max_workers=2) as pool:
+        handle = shared.publish(env)
+        results = list(pool.map(run_shared_episode, controllers, [handle] * 6, [60] * 6))
+
+    assert results == [rc.run_episode(env, max_steps=60) for rc in controllers]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from computational_autonomy.sweep import (
+    SweepResult,
+    configurations,
+    load_results,
+    main,
+    merge_results,
+    parse_int_axis,
+    run_config,
+    run_shard,
+    shard,
+)
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+
+
+def test_shards_partition_the_space_with_balanced_cost() -> None:
+    configs = configurations(
+        ["halt", "loop"], range(0, 20, 3), [5, 50, 500], [10, 60], ["default", "open"]
+    )
+    shards = [shard(configs, i, 4) for i in range(4)]
+
+    assert sorted(c for s in shards for c in s) == configs
+    assert shards == [shard(list(reversed(configs)), i, 4) for i in range(4)]
+
+    loads = [sum(c.cost for c in s) for s in shards]
+    assert max(loads) - min(loads) <= max(c.cost for c in configs)
+
+    with pytest.raises(ValueError):
+        _ = shard(configs, 4, 4)
+
+
+def test_run_shard_resumes_after_torn_write(tmp_path: Path) -> None:
+    configs = configurations(["halt", "loop"], [0, 3], [2, 10], [5], ["default"])
+    out = tmp_path / "shard.jsonl"
+
+    first = run_config(configs[0])
+    out.write_text(first.to_json() + "\n" + '{"program": "ha')
+
+    results = run_shard(configs, str(out))
+
+    assert [r.config for r in results] == configs
+    assert load_results(str(out)) == results
+    assert results[0] == first
+
+
+def test_merge_deduplicates_and_rejects_conflicts(tmp_path: Path) -> None:
+    configs = configurations(["halt"], [0, 1, 2], [1], [5], ["open"])
+    a, b = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+    run_shard(configs[:2], str(a))
+    run_shard(configs[1:], str(b))
+
+    results, duplicates = merge_results([str(a), str(b)])
+    assert [r.config for r in results] == configs
+    assert duplicates == 1
+
+    flipped = SweepResult(config=configs[0], safe=True, success=not results[0].success, steps=0)
+    (tmp_path / "c.jsonl").write_text(flipped.to_json() + "\n")
+    with pytest.raises(ValueError):
+        _ = merge_results([str(a), str(tmp_path / "c.jsonl")])
+
+
+def test_merge_leaves_inputs_untouched_and_skips_unfinished_last_line(tmp_path: Path) -> None:
+    configs = configurations(["halt"], [0, 1, 2], [1], [5], ["open"])
+    a, b = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+    run_shard(configs[:2], str(a))
+    b.write_text(run_config(configs[2]).to_json() + "\n" + '{"program": "ha')
+    before = {p: p.read_bytes() for p in (a, b)}
+
+    results, _ = merge_results([str(a), str(b)])
+
+    assert [r.config for r in results] == configs
+    assert {p: p.read_bytes() for p in (a, b)} == before
+
+
+def test_merge_rejects_malformed_line_inside_a_file(tmp_path: Path) -> None:
+    configs = configurations(["halt"], [0, 1, 2, 3], [1], [5], ["open"])
+    out = tmp_path / "shard.jsonl"
+    run_shard(configs, str(out))
+    lines = out.read_text().splitlines(keepends=True)
+    lines[1] = '{"garbage": 1}\n'
+    out.write_text("".join(lines))
+    before = out.read_bytes()
+
+    with pytest.raises(ValueError, match=re.escape(f"{out}:2:")):
+        _ = merge_results([str(out)])
+    with pytest.raises(ValueError, match=re.escape(f"{out}:2:")):
+        _ = run_shard(configs, str(out))
+    assert out.read_bytes() == before
+
+
+def test_parse_int_axis_expands_ranges() -> None:
+    assert parse_int_axis(["1", "5:8", "10:20:5"]) == [1, 5, 6, 7, 10, 15]
+
+
+def test_local_processes_as_nodes_match_single_run(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    axes = [
+        "--x",
+        "0:12:4",
+        "--bound",
+        "1",
+        "8",
+        "--max-steps",
+        "5",
+        "40",
+        "--preset",
+        "default",
+        "open",
+    ]
+    env = dict(os.environ, PYTHONPATH=SRC)
+    n = 3
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-m", "computational_autonomy.sweep", "run", *axes]
+            + ["--shard", f"{i}/{n}", "--out", str(tmp_path / f"shard{i}.jsonl")],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        for i in range(n)
+    ]
+    assert [p.wait() for p in procs] == [0] * n
+
+    assert main(["run", *axes, "--out", str(tmp_path / "single.jsonl")]) == 0
+    merged = tmp_path / "merged.jsonl"
+    inputs = [str(tmp_path / f"shard{i}.jsonl") for i in range(n)]
+    assert main(["merge", "--out", str(merged), *inputs]) == 0
+
+    assert merged.read_text() == (tmp_path / "single.jsonl").read_text()
+    out = capsys.readouterr().out
+    assert "configs=48" in out
+    assert "duplicates=0" in out
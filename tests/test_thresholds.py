@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pytest
+
+from computational_autonomy.environment import Environment
+from computational_autonomy.machine import CounterProgram, Instruction, Machine, MachineProgram, Op
+from computational_autonomy.reduction import ReductionController
+from computational_autonomy.thresholds import critical_bound, critical_max_steps
+
+
+def test_critical_bound_matches_linear_scan() -> None:
+    for x in [-3, 0, 1, 7, 100]:
+        m = Machine(program=MachineProgram.HALT, x=x)
+        expected = next(b for b in range(200) if m.simulate(b) is not None)
+        assert critical_bound(m, 10**12) == expected
+
+    assert critical_bound(Machine(program=MachineProgram.HALT, x=10**9), 10**6) is None
+    assert critical_bound(Machine(program=MachineProgram.LOOP, x=0), 10**6) is None
+
+    with pytest.raises(ValueError):
+        _ = critical_bound(Machine(program=MachineProgram.LOOP, x=0), -1)
+
+
+def test_critical_bound_is_the_halting_step_count_of_one_run() -> None:
+    # Each pass drains register 1 through a zero branch, so no loop is skipped.
+    drain = CounterProgram(
+        code=(
+            Instruction(Op.DEC, 0, next_pc=1, zero_pc=3),
+            Instruction(Op.DEC, 1, next_pc=1, zero_pc=2),
+            Instruction(Op.INC, 1, next_pc=0),
+            Instruction(Op.HALT),
+        ),
+        registers=2,
+    )
+    for x in [0, 1, 2, 9]:
+        m = Machine(program=drain, x=x)
+        expected = next(b for b in range(100) if m.simulate(b) is not None)
+        assert critical_bound(m, 10**6) == expected
+
+    m = Machine(program=drain, x=200_000)
+    assert critical_bound(m, 10**7) == 3 * 200_000 - 1
+    assert critical_bound(m, 3 * 200_000 - 2) is None
+
+
+def test_critical_max_steps_matches_linear_scan() -> None:
+    env = Environment.from_strings(["....", ".X..", "...G"], start=(0, 0))
+    rc = ReductionController(machine=Machine(MachineProgram.HALT, x=0), bound=5)
+    expected = next(m for m in range(1, 100) if rc.run_episode(env, max_steps=m)[1])
+
+    assert critical_max_steps(rc, env, 1000) == expected
+    assert critical_max_steps(rc, env, expected - 1) is None
+
+    with pytest.raises(ValueError):
+        _ = critical_max_steps(rc, env, 0)
+
+
+def test_critical_max_steps_is_none_for_cycles_and_inert_policy() -> None:
+    env = Environment.from_strings(["..X..", ".H.X.", "..X..", ".X..G", "....."], start=(0, 0))
+    halting = ReductionController(machine=Machine(MachineProgram.HALT, x=0), bound=5)
+    looping = ReductionController(machine=Machine(MachineProgram.LOOP, x=0), bound=5)
+
+    assert critical_max_steps(halting, env, 10**9) is None
+    assert critical_max_steps(looping, env, 10**9) is None